@@ -50,6 +50,11 @@ import (
 const (
 	// RalphDir is the directory where ralph stores its files.
 	RalphDir = ".ralph"
+
+	// ptyReadBufferSize is the chunk size for copying PTY output. A read
+	// returns whatever is available, so interactive output still streams
+	// immediately while bursts are copied in fewer syscalls.
+	ptyReadBufferSize = 32 * 1024
 )
 
 // RunOptions configures agent execution behavior.
@@ -140,22 +145,31 @@ func (r *Runner) createStreamProcessor() (*stream.Processor, *os.File) {
 	var rawLog io.Writer
 	var rawLogFile *os.File
 
-	// Enable raw JSON logging for agents with structured output
-	if err := os.MkdirAll(RalphDir, 0o755); err != nil {
-		if r.Verbose {
-			_, _ = fmt.Fprintf(r.Stderr, "[ralph] failed to create %s: %v\n", RalphDir, err)
+	// Enable raw JSON logging for agents with structured output.
+	// Open first and only create the directory if it is missing, so the
+	// common case (.ralph already exists) costs a single open per iteration.
+	logPath := filepath.Join(RalphDir, "stream-json.log")
+	file, err := openStreamLog(logPath)
+	mkdirFailed := false
+	if os.IsNotExist(err) {
+		if mkErr := os.MkdirAll(RalphDir, 0o755); mkErr != nil {
+			mkdirFailed = true
+			err = mkErr
+		} else {
+			file, err = openStreamLog(logPath)
 		}
-	} else {
-		logPath := filepath.Join(RalphDir, "stream-json.log")
-		file, err := os.OpenFile(logPath, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0o644)
-		if err != nil {
-			if r.Verbose {
+	}
+	if err != nil {
+		if r.Verbose {
+			if mkdirFailed {
+				_, _ = fmt.Fprintf(r.Stderr, "[ralph] failed to create %s: %v\n", RalphDir, err)
+			} else {
 				_, _ = fmt.Fprintf(r.Stderr, "[ralph] failed to open stream log %s: %v\n", logPath, err)
 			}
-		} else {
-			rawLogFile = file
-			rawLog = file
 		}
+	} else {
+		rawLogFile = file
+		rawLog = file
 	}
 
 	config := stream.DefaultFormatterConfig(filepath.Base(r.Settings.Agent.Command))
@@ -169,6 +183,11 @@ func (r *Runner) createStreamProcessor() (*stream.Processor, *os.File) {
 	return stream.NewProcessor(r.Settings.Agent.Command, formatter, debugLog, rawLog), rawLogFile
 }
 
+// openStreamLog opens the raw stream log for appending, creating it if needed.
+func openStreamLog(path string) (*os.File, error) {
+	return os.OpenFile(path, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0o644)
+}
+
 // configureOutput sets up stdout/stderr for the command based on streaming settings.
 func (r *Runner) configureOutput(cmd *exec.Cmd, outputBuf *bytes.Buffer, proc *stream.Processor) {
 	if r.Settings.StreamAgentOutput {
@@ -198,7 +217,7 @@ type flushWriterNoErr interface {
 }
 
 func streamPTY(src io.Reader, writers ...io.Writer) error {
-	buf := make([]byte, 1024)
+	buf := make([]byte, ptyReadBufferSize)
 	for {
 		n, err := src.Read(buf)
 		if n > 0 {
@@ -409,9 +428,66 @@ func (r *Runner) RunTextMode(ctx context.Context, prompt string, iteration int)
 	return outputBuf.String(), err
 }
 
+// shellMetaChars are characters that only mean something to a shell.
+// Commands containing any of them are always run through sh -c.
+const shellMetaChars = "'\"\\$`!*?[]{}()#<>&|;~=\n\r"
+
+// directArgs splits command into an argument list when it is a plain list of
+// words that the shell would pass through unchanged. Returns nil when the
+// command needs a shell.
+func directArgs(command string) []string {
+	if runtime.GOOS == "windows" || strings.ContainsAny(command, shellMetaChars) {
+		return nil
+	}
+	// Split only where sh does (space and tab; newlines are already excluded),
+	// so other whitespace such as a non-breaking space stays inside the word.
+	args := strings.FieldsFunc(command, func(r rune) bool {
+		return r == ' ' || r == '\t'
+	})
+	if len(args) == 0 {
+		return nil
+	}
+	return args
+}
+
 // RunShell executes a shell command and returns combined output.
 // Used for guardrails and SCM commands.
+// Simple commands are executed directly, skipping the intermediate shell.
 func RunShell(ctx context.Context, command string, stream bool, stdout, stderr io.Writer) (string, error) {
+	output, err := RunShellBytes(ctx, command, stream, stdout, stderr)
+	return string(output), err
+}
+
+// RunShellBytes is RunShell returning the combined output as bytes.
+// Callers that write the output to a file use it to skip a string round trip.
+func RunShellBytes(ctx context.Context, command string, stream bool, stdout, stderr io.Writer) ([]byte, error) {
+	var outputBuf bytes.Buffer
+	var cmdStdout, cmdStderr io.Writer = &outputBuf, &outputBuf
+	if stream {
+		cmdStdout = io.MultiWriter(&outputBuf, stdout)
+		cmdStderr = io.MultiWriter(&outputBuf, stderr)
+	}
+
+	if args := directArgs(command); args != nil {
+		// cmd.Err is set when the program is not on PATH (e.g. a shell builtin)
+		if cmd := exec.CommandContext(ctx, args[0], args[1:]...); cmd.Err == nil {
+			cmd.Stdout = cmdStdout
+			cmd.Stderr = cmdStderr
+			cmd.Stdin = nil
+
+			err := cmd.Start()
+			if err == nil {
+				err = cmd.Wait()
+				return outputBuf.Bytes(), err
+			}
+			if ctx.Err() != nil {
+				return outputBuf.Bytes(), err
+			}
+			// Could not start directly (e.g. a script without a shebang):
+			// let the shell handle it as before.
+		}
+	}
+
 	var shell, flag string
 	if runtime.GOOS == "windows" {
 		shell = "cmd"
@@ -422,19 +498,10 @@ func RunShell(ctx context.Context, command string, stream bool, stdout, stderr i
 	}
 
 	cmd := exec.CommandContext(ctx, shell, flag, command)
-
-	var outputBuf bytes.Buffer
-
-	if stream {
-		cmd.Stdout = io.MultiWriter(&outputBuf, stdout)
-		cmd.Stderr = io.MultiWriter(&outputBuf, stderr)
-	} else {
-		cmd.Stdout = &outputBuf
-		cmd.Stderr = &outputBuf
-	}
-
+	cmd.Stdout = cmdStdout
+	cmd.Stderr = cmdStderr
 	cmd.Stdin = nil
 
 	err := cmd.Run()
-	return outputBuf.String(), err
+	return outputBuf.Bytes(), err
 }
@@ -6,6 +6,8 @@ import (
 	"io"
 	"os"
 	"os/exec"
+	"path/filepath"
+	"runtime"
 	"testing"
 
 	"github.com/richclement/ralph-cli/internal/config"
@@ -212,6 +214,18 @@ func TestRunShell_Success(t *testing.T) {
 	}
 }
 
+func TestRunShellBytes_Success(t *testing.T) {
+	var stdout, stderr bytes.Buffer
+
+	output, err := RunShellBytes(context.Background(), "echo hello", false, &stdout, &stderr)
+	if err != nil {
+		t.Errorf("Expected no error, got %v", err)
+	}
+	if string(output) != "hello\n" {
+		t.Errorf("Expected 'hello\\n', got %q", output)
+	}
+}
+
 func TestRunShell_WithStream(t *testing.T) {
 	var stdout, stderr bytes.Buffer
 
@@ -251,6 +265,98 @@ func TestRunShell_CancelledContext(t *testing.T) {
 	}
 }
 
+func TestRunShell_ShellSyntax(t *testing.T) {
+	var stdout, stderr bytes.Buffer
+
+	output, err := RunShell(context.Background(), "echo one && echo two", false, &stdout, &stderr)
+	if err != nil {
+		t.Errorf("Expected no error, got %v", err)
+	}
+	if output != "one\ntwo\n" {
+		t.Errorf("Expected 'one\\ntwo\\n', got %q", output)
+	}
+}
+
+func TestRunShell_BuiltinFallsBackToShell(t *testing.T) {
+	var stdout, stderr bytes.Buffer
+
+	_, err := RunShell(context.Background(), "exit 3", false, &stdout, &stderr)
+	exitErr, ok := err.(*exec.ExitError)
+	if !ok {
+		t.Fatalf("Expected *exec.ExitError, got %v", err)
+	}
+	if exitErr.ExitCode() != 3 {
+		t.Errorf("Expected exit code 3, got %d", exitErr.ExitCode())
+	}
+}
+
+func TestDirectArgs(t *testing.T) {
+	if runtime.GOOS == "windows" {
+		t.Skip("commands always run through cmd /c on Windows")
+	}
+
+	tests := []struct {
+		name    string
+		command string
+		want    []string
+	}{
+		{
+			name:    "simple command",
+			command: "echo hello  world",
+			want:    []string{"echo", "hello", "world"},
+		},
+		{
+			name:    "empty command",
+			command: "   ",
+			want:    nil,
+		},
+		{
+			name:    "operators need shell",
+			command: "echo a && echo b",
+			want:    nil,
+		},
+		{
+			name:    "quotes need shell",
+			command: `echo "a b"`,
+			want:    nil,
+		},
+		{
+			name:    "variables need shell",
+			command: "echo $HOME",
+			want:    nil,
+		},
+		{
+			name:    "env assignment needs shell",
+			command: "FOO=1 echo hi",
+			want:    nil,
+		},
+		{
+			name:    "multiple lines need shell",
+			command: "echo a\necho b",
+			want:    nil,
+		},
+		{
+			name:    "only space and tab separate words",
+			command: "make\u00a0test\tall\vx",
+			want:    []string{"make\u00a0test", "all\vx"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := directArgs(tt.command)
+			if len(got) != len(tt.want) {
+				t.Fatalf("directArgs(%q) = %q, want %q", tt.command, got, tt.want)
+			}
+			for i := range got {
+				if got[i] != tt.want[i] {
+					t.Errorf("directArgs(%q)[%d] = %q, want %q", tt.command, i, got[i], tt.want[i])
+				}
+			}
+		})
+	}
+}
+
 func TestBuildArgs_Codex(t *testing.T) {
 	// Create .ralph directory for prompt file
 	if err := os.MkdirAll(RalphDir, 0o755); err != nil {
@@ -1101,6 +1207,35 @@ func TestCreateStreamProcessor_Enabled(t *testing.T) {
 	}
 }
 
+func TestCreateStreamProcessor_CreatesMissingRalphDir(t *testing.T) {
+	_ = os.RemoveAll(RalphDir)
+	defer func() { _ = os.RemoveAll(RalphDir) }()
+
+	settings := &config.Settings{
+		Agent: config.AgentConfig{
+			Command: "claude",
+		},
+		StreamAgentOutput: true,
+	}
+
+	var stdout bytes.Buffer
+	r := NewRunner(settings)
+	r.Stdout = &stdout
+
+	proc, logFile := r.createStreamProcessor()
+	if proc != nil {
+		_ = proc.Close()
+	}
+	if logFile == nil {
+		t.Fatal("Expected non-nil log file when .ralph is missing")
+	}
+	_ = logFile.Close()
+
+	if _, err := os.Stat(filepath.Join(RalphDir, "stream-json.log")); err != nil {
+		t.Errorf("Expected stream log to be created: %v", err)
+	}
+}
+
 func TestCreateStreamProcessor_UnknownAgent(t *testing.T) {
 	// Create .ralph directory for log file
 	if err := os.MkdirAll(RalphDir, 0o755); err != nil {
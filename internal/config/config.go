@@ -16,6 +16,9 @@ const (
 	DefaultStreamAgentOutput   = true
 )
 
+// validFailActions lists the accepted guardrail failAction values (upper-cased).
+var validFailActions = map[string]bool{"APPEND": true, "PREPEND": true, "REPLACE": true}
+
 // Settings represents the runtime configuration.
 type Settings struct {
 	MaximumIterations             int            `json:"maximumIterations"`
@@ -23,6 +26,7 @@ type Settings struct {
 	OutputTruncateChars           int            `json:"outputTruncateChars"`
 	StreamAgentOutput             bool           `json:"streamAgentOutput"`
 	IncludeIterationCountInPrompt bool           `json:"includeIterationCountInPrompt"`
+	ParallelGuardrails            bool           `json:"parallelGuardrails"`
 	Agent                         AgentConfig    `json:"agent"`
 	Guardrails                    []Guardrail    `json:"guardrails"`
 	SCM                           *SCMConfig     `json:"scm,omitempty"`
@@ -191,6 +195,13 @@ func deepMerge(settings *Settings, data []byte) error {
 		}
 		settings.IncludeIterationCountInPrompt = val
 	}
+	if v, ok := local["parallelGuardrails"]; ok {
+		var val bool
+		if err := json.Unmarshal(v, &val); err != nil {
+			return fmt.Errorf("parallelGuardrails: %w", err)
+		}
+		settings.ParallelGuardrails = val
+	}
 
 	// Handle agent object (recursive merge)
 	if v, ok := local["agent"]; ok {
@@ -316,13 +327,12 @@ func (s *Settings) Validate() error {
 	}
 
 	// Validate guardrails
-	validActions := map[string]bool{"APPEND": true, "PREPEND": true, "REPLACE": true}
 	for i, g := range s.Guardrails {
 		if g.Command == "" {
 			return fmt.Errorf("guardrails[%d].command must not be empty", i)
 		}
 		action := strings.ToUpper(g.FailAction)
-		if !validActions[action] {
+		if !validFailActions[action] {
 			return fmt.Errorf("guardrails[%d].failAction must be APPEND, PREPEND, or REPLACE, got %q", i, g.FailAction)
 		}
 	}
@@ -24,6 +24,9 @@ func TestNewDefaults(t *testing.T) {
 	if s.IncludeIterationCountInPrompt {
 		t.Errorf("IncludeIterationCountInPrompt = %v, want false", s.IncludeIterationCountInPrompt)
 	}
+	if s.ParallelGuardrails {
+		t.Errorf("ParallelGuardrails = %v, want false", s.ParallelGuardrails)
+	}
 }
 
 func TestLoad_FileNotFound(t *testing.T) {
@@ -94,7 +97,7 @@ func TestDeepMerge_ScalarOverride(t *testing.T) {
 	s.Agent.Command = "claude"
 	s.Agent.Flags = []string{"--model", "opus"}
 
-	localJSON := `{"maximumIterations": 20, "completionResponse": "COMPLETE", "includeIterationCountInPrompt": true}`
+	localJSON := `{"maximumIterations": 20, "completionResponse": "COMPLETE", "includeIterationCountInPrompt": true, "parallelGuardrails": true}`
 	if err := deepMerge(&s, []byte(localJSON)); err != nil {
 		t.Fatal(err)
 	}
@@ -108,6 +111,9 @@ func TestDeepMerge_ScalarOverride(t *testing.T) {
 	if s.IncludeIterationCountInPrompt != true {
 		t.Errorf("IncludeIterationCountInPrompt = %v, want true", s.IncludeIterationCountInPrompt)
 	}
+	if s.ParallelGuardrails != true {
+		t.Errorf("ParallelGuardrails = %v, want true", s.ParallelGuardrails)
+	}
 	// Should preserve existing agent
 	if s.Agent.Command != "claude" {
 		t.Errorf("Agent.Command = %q, should be preserved", s.Agent.Command)
@@ -371,6 +377,11 @@ func TestDeepMerge_InvalidTypeErrors(t *testing.T) {
 			localJSON: `{"streamAgentOutput": "not-a-bool"}`,
 			wantErr:   "streamAgentOutput:",
 		},
+		{
+			name:      "parallelGuardrails wrong type",
+			localJSON: `{"parallelGuardrails": "not-a-bool"}`,
+			wantErr:   "parallelGuardrails:",
+		},
 		{
 			name:      "agent wrong type",
 			localJSON: `{"agent": "not-an-object"}`,
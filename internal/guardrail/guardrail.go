@@ -7,8 +7,8 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
-	"regexp"
 	"strings"
+	"sync"
 
 	"github.com/richclement/ralph-cli/internal/agent"
 	"github.com/richclement/ralph-cli/internal/config"
@@ -23,6 +23,18 @@ const (
 	truncateIndicator = "... [truncated]"
 )
 
+// slugChars marks the bytes kept as-is in a slug (ASCII letters and digits).
+var slugChars = func() (table [256]bool) {
+	for c := '0'; c <= '9'; c++ {
+		table[c] = true
+	}
+	for c := 'a'; c <= 'z'; c++ {
+		table[c] = true
+		table[c-'a'+'A'] = true
+	}
+	return table
+}()
+
 // Result holds the outcome of running a guardrail.
 type Result struct {
 	Guardrail config.Guardrail
@@ -39,6 +51,7 @@ type Runner struct {
 	Stdout              io.Writer
 	Stderr              io.Writer
 	Verbose             bool
+	Parallel            bool // Run guardrails concurrently in RunAll
 }
 
 // NewRunner creates a new guardrail runner.
@@ -61,15 +74,26 @@ func (r *Runner) Run(ctx context.Context, g config.Guardrail, iteration int) Res
 // RunWithSlugTracker executes a single guardrail with slug collision tracking.
 // The slugCounts map tracks how many times each slug has been used.
 func (r *Runner) RunWithSlugTracker(ctx context.Context, g config.Guardrail, iteration int, slugCounts map[string]int) Result {
+	logFile := r.generateLogFilename(iteration, GenerateSlug(g.Command), slugCounts)
+
+	r.print("Guardrail start: %s", g.Command)
+	result, output := r.execute(ctx, g)
+	r.finish(&result, output, logFile)
+
+	return result
+}
+
+// execute runs the guardrail command and captures its output and exit code.
+// The raw output is returned alongside the result for writing the log file.
+// It neither prints nor writes files, so it is safe to call concurrently.
+func (r *Runner) execute(ctx context.Context, g config.Guardrail) (Result, []byte) {
 	result := Result{
 		Guardrail: g,
 	}
 
-	r.print("Guardrail start: %s", g.Command)
-
 	// Run the command
-	output, err := agent.RunShell(ctx, g.Command, false, r.Stdout, r.Stderr)
-	result.Output = output
+	output, err := agent.RunShellBytes(ctx, g.Command, false, r.Stdout, r.Stderr)
+	result.Output = string(output)
 	result.Success = err == nil
 
 	// Extract exit code from error
@@ -81,21 +105,21 @@ func (r *Runner) RunWithSlugTracker(ctx context.Context, g config.Guardrail, ite
 		}
 	}
 
-	// Write full output to log file with de-duplication
-	slug := GenerateSlug(g.Command)
-	logFile := r.generateLogFilename(iteration, slug, slugCounts)
-	if writeErr := os.WriteFile(logFile, []byte(output), 0o644); writeErr != nil {
+	return result, output
+}
+
+// finish writes the full output to the log file and reports the result.
+func (r *Runner) finish(result *Result, output []byte, logFile string) {
+	if writeErr := os.WriteFile(logFile, output, 0o644); writeErr != nil {
 		_, _ = fmt.Fprintf(r.Stderr, "[ralph] warning: failed to write guardrail log: %v\n", writeErr)
 	}
 	result.LogFile = logFile
 
 	if result.Success {
-		r.print("Guardrail end: %s (exit 0)", g.Command)
+		r.print("Guardrail end: %s (exit 0)", result.Guardrail.Command)
 	} else {
-		r.print("Guardrail end: %s (exit %d, action=%s)", g.Command, result.ExitCode, g.FailAction)
+		r.print("Guardrail end: %s (exit %d, action=%s)", result.Guardrail.Command, result.ExitCode, result.Guardrail.FailAction)
 	}
-
-	return result
 }
 
 // generateLogFilename creates a unique log filename, handling duplicate slugs.
@@ -123,7 +147,13 @@ func (r *Runner) print(format string, args ...any) {
 
 // RunAll executes all guardrails and returns results.
 // Handles duplicate slug collisions by adding index suffixes to log filenames.
+// When Parallel is set, guardrails run concurrently; results, log filenames,
+// and status lines keep the configured order.
 func (r *Runner) RunAll(ctx context.Context, guardrails []config.Guardrail, iteration int) []Result {
+	if r.Parallel && len(guardrails) > 1 {
+		return r.runAllParallel(ctx, guardrails, iteration)
+	}
+
 	results := make([]Result, 0, len(guardrails))
 	slugCounts := make(map[string]int)
 	for _, g := range guardrails {
@@ -133,6 +163,35 @@ func (r *Runner) RunAll(ctx context.Context, guardrails []config.Guardrail, iter
 	return results
 }
 
+// runAllParallel runs every guardrail in its own goroutine.
+// Log filenames are assigned and status lines printed from the calling
+// goroutine, so the only concurrent work is the commands themselves.
+func (r *Runner) runAllParallel(ctx context.Context, guardrails []config.Guardrail, iteration int) []Result {
+	slugCounts := make(map[string]int)
+	logFiles := make([]string, len(guardrails))
+	for i, g := range guardrails {
+		logFiles[i] = r.generateLogFilename(iteration, GenerateSlug(g.Command), slugCounts)
+		r.print("Guardrail start: %s", g.Command)
+	}
+
+	results := make([]Result, len(guardrails))
+	outputs := make([][]byte, len(guardrails))
+	var wg sync.WaitGroup
+	for i, g := range guardrails {
+		wg.Add(1)
+		go func(i int, g config.Guardrail) {
+			defer wg.Done()
+			results[i], outputs[i] = r.execute(ctx, g)
+		}(i, g)
+	}
+	wg.Wait()
+
+	for i := range results {
+		r.finish(&results[i], outputs[i], logFiles[i])
+	}
+	return results
+}
+
 // AllPassed returns true if all guardrail results were successful.
 func AllPassed(results []Result) bool {
 	for _, r := range results {
@@ -167,12 +226,21 @@ func TruncateOutput(output string, limit int) string {
 
 // GenerateSlug creates a filesystem-safe slug from a command string.
 func GenerateSlug(command string) string {
-	// Replace non-alphanumeric characters with underscores
-	re := regexp.MustCompile(`[^a-zA-Z0-9]+`)
-	slug := re.ReplaceAllString(command, "_")
+	// Replace each run of non-alphanumeric characters with one underscore.
+	// Multi-byte UTF-8 characters are never alphanumeric here, so working
+	// byte by byte gives the same result as a rune-based replacement.
+	buf := make([]byte, 0, len(command))
+	for i := 0; i < len(command); i++ {
+		c := command[i]
+		if slugChars[c] {
+			buf = append(buf, c)
+		} else if len(buf) == 0 || buf[len(buf)-1] != '_' {
+			buf = append(buf, '_')
+		}
+	}
 
 	// Trim leading/trailing underscores
-	slug = strings.Trim(slug, "_")
+	slug := strings.Trim(string(buf), "_")
 
 	// Truncate to 50 chars
 	if len(slug) > 50 {
@@ -208,12 +276,36 @@ func GetFailedResults(results []Result) []Result {
 
 // InjectFailures applies all failed guardrail results to a prompt using their fail actions.
 // Returns the modified prompt with all failure messages injected.
+// The result matches calling ApplyFailAction once per failure in order, but the
+// prompt is assembled in a single join instead of being re-copied per failure.
 func InjectFailures(prompt string, failedResults []Result, truncateLimit int) string {
+	var prepends, appends []string
 	for _, result := range failedResults {
 		failureMessage := FormatFailureMessage(result, truncateLimit)
-		prompt = ApplyFailAction(prompt, failureMessage, result.Guardrail.FailAction)
+		switch strings.ToUpper(result.Guardrail.FailAction) {
+		case ActionPrepend:
+			prepends = append(prepends, failureMessage)
+		case ActionReplace:
+			// Discards everything injected so far, same as sequential application
+			prompt = failureMessage
+			prepends = prepends[:0]
+			appends = appends[:0]
+		default:
+			appends = append(appends, failureMessage)
+		}
 	}
-	return prompt
+	if len(prepends) == 0 && len(appends) == 0 {
+		return prompt
+	}
+
+	// Later prepends end up in front of earlier ones
+	parts := make([]string, 0, len(prepends)+1+len(appends))
+	for i := len(prepends) - 1; i >= 0; i-- {
+		parts = append(parts, prepends[i])
+	}
+	parts = append(parts, prompt)
+	parts = append(parts, appends...)
+	return strings.Join(parts, "\n\n")
 }
 
 // FormatFailureMessage formats a single guardrail failure for inclusion in the prompt.
@@ -224,7 +316,7 @@ func FormatFailureMessage(result Result, truncateLimit int) string {
 	// Build the message with optional hint
 	var hintLine string
 	if result.Guardrail.Hint != "" {
-		hintLine = fmt.Sprintf("Hint: %s\n", result.Guardrail.Hint)
+		hintLine = "Hint: " + result.Guardrail.Hint + "\n"
 	}
 
 	return fmt.Sprintf(`Guardrail "%s" failed with exit code %d.
@@ -3,7 +3,10 @@ package guardrail
 import (
 	"bytes"
 	"context"
+	"fmt"
 	"os"
+	"path/filepath"
+	"regexp"
 	"strings"
 	"testing"
 
@@ -48,6 +51,30 @@ func TestGenerateSlug(t *testing.T) {
 	}
 }
 
+func TestGenerateSlug_MatchesRegexReplacement(t *testing.T) {
+	re := regexp.MustCompile(`[^a-zA-Z0-9]+`)
+	commands := []string{
+		"",
+		"___",
+		"make   test",
+		"a__b--c",
+		"go test ./... -run 'TestFoo|TestBar'",
+		"echo héllo wörld ✅ done",
+		"invalid \xff\xfe utf8",
+		"ZZ_top 09 az AZ",
+	}
+
+	for _, command := range commands {
+		want := strings.Trim(re.ReplaceAllString(command, "_"), "_")
+		if len(want) > 50 {
+			want = want[:50]
+		}
+		if got := GenerateSlug(command); got != want {
+			t.Errorf("GenerateSlug(%q) = %q, want %q", command, got, want)
+		}
+	}
+}
+
 func TestTruncateOutput(t *testing.T) {
 	tests := []struct {
 		name   string
@@ -143,6 +170,52 @@ func TestApplyFailAction(t *testing.T) {
 	}
 }
 
+func TestInjectFailures_MatchesSequentialApply(t *testing.T) {
+	failure := func(cmd, action string) Result {
+		return Result{
+			Guardrail: config.Guardrail{Command: cmd, FailAction: action},
+			Output:    cmd + " output",
+			ExitCode:  1,
+			LogFile:   cmd + ".log",
+		}
+	}
+
+	tests := []struct {
+		name    string
+		results []Result
+	}{
+		{name: "no failures", results: nil},
+		{name: "single append", results: []Result{failure("a", "APPEND")}},
+		{name: "single replace", results: []Result{failure("a", "REPLACE")}},
+		{name: "mixed append and prepend", results: []Result{
+			failure("a", "APPEND"),
+			failure("b", "prepend"),
+			failure("c", "APPEND"),
+			failure("d", "PREPEND"),
+		}},
+		{name: "replace discards earlier", results: []Result{
+			failure("a", "PREPEND"),
+			failure("b", "APPEND"),
+			failure("c", "REPLACE"),
+			failure("d", "PREPEND"),
+			failure("e", "unknown"),
+		}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			want := "base prompt"
+			for _, r := range tt.results {
+				want = ApplyFailAction(want, FormatFailureMessage(r, 100), r.Guardrail.FailAction)
+			}
+			got := InjectFailures("base prompt", tt.results, 100)
+			if got != want {
+				t.Errorf("InjectFailures() = %q, want %q", got, want)
+			}
+		})
+	}
+}
+
 func TestGenerateLogFilename(t *testing.T) {
 	r := &Runner{OutputDir: ".ralph"}
 
@@ -361,6 +434,52 @@ func TestFormatFailureMessage(t *testing.T) {
 	}
 }
 
+func TestFormatFailureMessage_ExactFormat(t *testing.T) {
+	tests := []struct {
+		name   string
+		result Result
+		limit  int
+		want   string
+	}{
+		{
+			name: "without hint",
+			result: Result{
+				Guardrail: config.Guardrail{Command: "make test"},
+				Output:    "boom",
+				ExitCode:  2,
+				LogFile:   ".ralph/guardrail_001_make_test.log",
+			},
+			limit: 100,
+			want: "Guardrail \"make test\" failed with exit code 2.\n" +
+				"Output file: .ralph/guardrail_001_make_test.log\n" +
+				"Output (truncated):\nboom",
+		},
+		{
+			name: "with hint and truncation",
+			result: Result{
+				Guardrail: config.Guardrail{Command: "make lint", Hint: "Fix lint only."},
+				Output:    "0123456789",
+				ExitCode:  1,
+				LogFile:   "lint.log",
+			},
+			limit: 4,
+			want: "Guardrail \"make lint\" failed with exit code 1.\n" +
+				"Hint: Fix lint only.\n" +
+				"Output file: lint.log\n" +
+				"Output (truncated):\n0123" + truncateIndicator,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := FormatFailureMessage(tt.result, tt.limit)
+			if got != tt.want {
+				t.Errorf("FormatFailureMessage() = %q, want %q", got, tt.want)
+			}
+		})
+	}
+}
+
 func TestFormatFailureMessage_WithTruncation(t *testing.T) {
 	result := Result{
 		Guardrail: config.Guardrail{Command: "make test"},
@@ -618,6 +737,99 @@ func TestRunner_RunAll_DuplicateSlugs(t *testing.T) {
 	}
 }
 
+func TestRunner_RunAll_Parallel(t *testing.T) {
+	tmpDir := t.TempDir()
+
+	var stderr bytes.Buffer
+	runner := &Runner{
+		OutputDir:           tmpDir,
+		OutputTruncateChars: 1000,
+		Stdout:              &bytes.Buffer{},
+		Stderr:              &stderr,
+		Parallel:            true,
+	}
+
+	guardrails := []config.Guardrail{
+		{Command: "sleep 0.2 && echo first", FailAction: "APPEND"},
+		{Command: "echo second && exit 3", FailAction: "PREPEND"},
+		{Command: "echo first", FailAction: "APPEND"},
+	}
+
+	results := runner.RunAll(context.Background(), guardrails, 2)
+
+	if len(results) != 3 {
+		t.Fatalf("Expected 3 results, got %d", len(results))
+	}
+	for i, g := range guardrails {
+		if results[i].Guardrail.Command != g.Command {
+			t.Errorf("results[%d] is for %q, want %q", i, results[i].Guardrail.Command, g.Command)
+		}
+	}
+	if !results[0].Success || results[1].Success || !results[2].Success {
+		t.Errorf("Unexpected success flags: %v %v %v", results[0].Success, results[1].Success, results[2].Success)
+	}
+	if results[1].ExitCode != 3 {
+		t.Errorf("Expected exit code 3, got %d", results[1].ExitCode)
+	}
+
+	// Log files follow configured order, including slug de-duplication
+	wantLogs := []string{
+		"guardrail_002_sleep_0_2_echo_first.log",
+		"guardrail_002_echo_second_exit_3.log",
+		"guardrail_002_echo_first.log",
+	}
+	for i, want := range wantLogs {
+		if results[i].LogFile != filepath.Join(tmpDir, want) {
+			t.Errorf("results[%d].LogFile = %q, want %q", i, results[i].LogFile, want)
+		}
+		content, err := os.ReadFile(results[i].LogFile)
+		if err != nil {
+			t.Fatalf("Failed to read log file: %v", err)
+		}
+		if string(content) != results[i].Output {
+			t.Errorf("Log file content = %q, want %q", content, results[i].Output)
+		}
+	}
+
+	// Status lines are printed in configured order
+	out := stderr.String()
+	first := strings.Index(out, "Guardrail end: sleep 0.2 && echo first")
+	second := strings.Index(out, "Guardrail end: echo second && exit 3")
+	if first < 0 || second < 0 || first > second {
+		t.Errorf("Expected end lines in configured order, got %q", out)
+	}
+}
+
+func TestRunner_RunAll_ParallelRunsConcurrently(t *testing.T) {
+	tmpDir := t.TempDir()
+	runner := &Runner{
+		OutputDir:           tmpDir,
+		OutputTruncateChars: 1000,
+		Stdout:              &bytes.Buffer{},
+		Stderr:              &bytes.Buffer{},
+		Parallel:            true,
+	}
+
+	// Each guardrail creates its own marker, then waits (up to ~10s) for the
+	// other's. Run one after another, the first one times out and fails.
+	rendezvous := func(own, other string) string {
+		return fmt.Sprintf(`touch %q; i=0; while [ ! -f %q ] && [ $i -lt 200 ]; do sleep 0.05; i=$((i+1)); done; test -f %q`,
+			filepath.Join(tmpDir, own), filepath.Join(tmpDir, other), filepath.Join(tmpDir, other))
+	}
+	guardrails := []config.Guardrail{
+		{Command: rendezvous("a.marker", "b.marker"), FailAction: "APPEND"},
+		{Command: rendezvous("b.marker", "a.marker"), FailAction: "APPEND"},
+	}
+
+	results := runner.RunAll(context.Background(), guardrails, 1)
+
+	for i, res := range results {
+		if !res.Success {
+			t.Errorf("results[%d] failed (exit %d); guardrails did not run concurrently", i, res.ExitCode)
+		}
+	}
+}
+
 func TestGetFailedOutputForPrompt_NoFailures(t *testing.T) {
 	results := []Result{
 		{Success: true},
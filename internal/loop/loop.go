@@ -64,6 +64,7 @@ func NewRunner(opts Options) *Runner {
 	guardrailRunner := guardrail.NewRunner(opts.Settings.OutputTruncateChars, opts.Verbose)
 	guardrailRunner.Stdout = opts.Stdout
 	guardrailRunner.Stderr = opts.Stderr
+	guardrailRunner.Parallel = opts.Settings.ParallelGuardrails
 
 	scmRunner := scm.NewRunner(opts.Settings, opts.Verbose)
 	scmRunner.Stdout = opts.Stdout
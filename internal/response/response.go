@@ -70,120 +70,118 @@ func ExtractFromJSON(output string) (string, bool) {
 	debugf("ExtractFromJSON: scanning %d bytes of output", len(output))
 
 	// Scan backwards for efficiency - result is always last
-	lines := strings.Split(output, "\n")
-	debugf("ExtractFromJSON: found %d lines", len(lines))
+	var result string
+	found := false
 
 	// Check for Claude/Amp result format
-	for i := len(lines) - 1; i >= 0; i-- {
-		line := strings.TrimSpace(lines[i])
-		if line == "" {
-			continue
-		}
-
+	eachLineReverse(output, func(line string) bool {
 		// Quick check before parsing
 		if !strings.Contains(line, `"type":"result"`) {
-			continue
+			return true
 		}
 
-		debugf("ExtractFromJSON: found result line at index %d, length=%d", i, len(line))
+		debugf("ExtractFromJSON: found result line, length=%d", len(line))
 
 		var msg resultMessage
 		if err := json.Unmarshal([]byte(line), &msg); err != nil {
 			debugf("ExtractFromJSON: JSON unmarshal error: %v", err)
-			continue
+			return true
 		}
 
-		if msg.Type == "result" {
-			debugf("ExtractFromJSON: extracted result field, length=%d", len(msg.Result))
-			debugf("ExtractFromJSON: result preview (last 200 chars): %s", lastN(msg.Result, 200))
-			return msg.Result, true
+		if msg.Type != "result" {
+			return true
 		}
+		debugf("ExtractFromJSON: extracted result field, length=%d", len(msg.Result))
+		debugf("ExtractFromJSON: result preview (last 200 chars): %s", lastN(msg.Result, 200))
+		result, found = msg.Result, true
+		return false
+	})
+	if found {
+		return result, true
 	}
 
 	// Check for Codex turn.completed format
-	if result, found := extractFromCodexJSON(lines); found {
-		return result, true
+	if text, ok := extractFromCodexJSON(output); ok {
+		return text, true
 	}
 
 	// Fall back to assistant text content for <response> tags
-	for i := len(lines) - 1; i >= 0; i-- {
-		line := strings.TrimSpace(lines[i])
-		if line == "" {
-			continue
-		}
+	eachLineReverse(output, func(line string) bool {
 		if !strings.Contains(line, `"type":"assistant"`) {
-			continue
+			return true
 		}
 
 		var msg assistantMessage
 		if err := json.Unmarshal([]byte(line), &msg); err != nil {
-			continue
+			return true
 		}
 		if msg.Type != "assistant" || msg.Message == nil {
-			continue
+			return true
 		}
 		for _, content := range msg.Message.Content {
 			if content.Type != "text" || content.Text == "" {
 				continue
 			}
-			if resp, found := ExtractResponse(content.Text); found {
-				return resp, true
+			if resp, ok := ExtractResponse(content.Text); ok {
+				result, found = resp, true
+				return false
 			}
 		}
-	}
-	return "", false
+		return true
+	})
+	return result, found
 }
 
 // extractFromCodexJSON handles Codex-specific JSON format.
 // Codex signals completion with turn.completed and puts text in item.completed agent_message items.
-func extractFromCodexJSON(lines []string) (string, bool) {
+func extractFromCodexJSON(output string) (string, bool) {
 	// First, verify we have a turn.completed message
 	hasTurnCompleted := false
-	for i := len(lines) - 1; i >= 0; i-- {
-		line := strings.TrimSpace(lines[i])
-		if line == "" {
-			continue
-		}
+	eachLineReverse(output, func(line string) bool {
 		if !strings.Contains(line, `"type":"turn.completed"`) {
-			continue
+			return true
 		}
 
 		var msg codexTurnCompleted
 		if err := json.Unmarshal([]byte(line), &msg); err != nil {
-			continue
+			return true
 		}
-		if msg.Type == "turn.completed" {
-			hasTurnCompleted = true
-			debugf("extractFromCodexJSON: found turn.completed")
-			break
+		if msg.Type != "turn.completed" {
+			return true
 		}
-	}
+		hasTurnCompleted = true
+		debugf("extractFromCodexJSON: found turn.completed")
+		return false
+	})
 
 	if !hasTurnCompleted {
 		return "", false
 	}
 
 	// Find the last agent_message item.completed
-	for i := len(lines) - 1; i >= 0; i-- {
-		line := strings.TrimSpace(lines[i])
-		if line == "" {
-			continue
-		}
+	var text string
+	found := false
+	eachLineReverse(output, func(line string) bool {
 		if !strings.Contains(line, `"type":"item.completed"`) {
-			continue
+			return true
 		}
 		if !strings.Contains(line, `"agent_message"`) {
-			continue
+			return true
 		}
 
 		var msg codexItemCompleted
 		if err := json.Unmarshal([]byte(line), &msg); err != nil {
-			continue
+			return true
 		}
-		if msg.Type == "item.completed" && msg.Item != nil && msg.Item.Type == "agent_message" {
-			debugf("extractFromCodexJSON: found agent_message, length=%d", len(msg.Item.Text))
-			return msg.Item.Text, true
+		if msg.Type != "item.completed" || msg.Item == nil || msg.Item.Type != "agent_message" {
+			return true
 		}
+		debugf("extractFromCodexJSON: found agent_message, length=%d", len(msg.Item.Text))
+		text, found = msg.Item.Text, true
+		return false
+	})
+	if found {
+		return text, true
 	}
 
 	// turn.completed without agent_message - return empty but found (signals completion)
@@ -191,6 +189,24 @@ func extractFromCodexJSON(lines []string) (string, bool) {
 	return "", true
 }
 
+// eachLineReverse calls fn with each trimmed, non-empty line of output,
+// starting from the last line, until fn returns false.
+// Lines are sliced out of output in place, so when the match sits near the
+// end of a large stream only the tail is scanned and nothing is allocated.
+func eachLineReverse(output string, fn func(line string) bool) {
+	end := len(output)
+	for {
+		start := strings.LastIndexByte(output[:end], '\n') + 1
+		if line := strings.TrimSpace(output[start:end]); line != "" && !fn(line) {
+			return
+		}
+		if start == 0 {
+			return
+		}
+		end = start - 1
+	}
+}
+
 // IsComplete checks if agent output indicates completion.
 // Requires stream-json mode output with a {"type":"result"} message.
 // Matches if result ends with completionResponse (case-insensitive).
@@ -217,6 +217,69 @@ func TestExtractFromJSON(t *testing.T) {
 	}
 }
 
+func TestEachLineReverse(t *testing.T) {
+	tests := []struct {
+		name   string
+		output string
+		want   []string
+	}{
+		{
+			name:   "empty output",
+			output: "",
+			want:   nil,
+		},
+		{
+			name:   "single line",
+			output: "only",
+			want:   []string{"only"},
+		},
+		{
+			name:   "trailing newline",
+			output: "a\nb\n",
+			want:   []string{"b", "a"},
+		},
+		{
+			name:   "skips blank and trims",
+			output: "  a \r\n\n\t\n b",
+			want:   []string{"b", "a"},
+		},
+		{
+			name:   "leading newline",
+			output: "\na",
+			want:   []string{"a"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var got []string
+			eachLineReverse(tt.output, func(line string) bool {
+				got = append(got, line)
+				return true
+			})
+			if len(got) != len(tt.want) {
+				t.Fatalf("eachLineReverse() = %q, want %q", got, tt.want)
+			}
+			for i := range got {
+				if got[i] != tt.want[i] {
+					t.Errorf("eachLineReverse()[%d] = %q, want %q", i, got[i], tt.want[i])
+				}
+			}
+		})
+	}
+}
+
+func TestEachLineReverse_StopsEarly(t *testing.T) {
+	calls := 0
+	eachLineReverse("a\nb\nc", func(line string) bool {
+		calls++
+		return line != "b"
+	})
+	if calls != 2 {
+		t.Errorf("eachLineReverse() visited %d lines, want 2", calls)
+	}
+}
+
 func TestIsComplete_JSON(t *testing.T) {
 	output := `{"type":"assistant"}` + "\n" + `{"type":"result","result":"done"}`
 
@@ -11,6 +11,11 @@ import (
 	"time"
 )
 
+// readBufferSize sizes the decoder's read buffer. Agent events (tool results,
+// file contents) are often several KB, so a larger buffer means fewer reads
+// from the pipe per line.
+const readBufferSize = 64 * 1024
+
 // Processor decodes JSON stream and formats events
 type Processor struct {
 	parser     Parser
@@ -61,7 +66,7 @@ func (p *Processor) decodeLoop() {
 	defer close(p.done)
 
 	// Read newline-delimited JSON without line length limits.
-	reader := bufio.NewReader(p.pipeReader)
+	reader := bufio.NewReaderSize(p.pipeReader, readBufferSize)
 
 	for {
 		line, err := reader.ReadBytes('\n')